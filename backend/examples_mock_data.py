@@ -28,11 +28,11 @@ def example_1_available_datasets():
     
     for dataset_key, dataset_info in MOCK_DATASETS.items():
         print(f"📊 {dataset_key}")
-        print(f"   Name: {dataset_info['name']}")
-        print(f"   Format: {dataset_info['file_format']}")
-        print(f"   Cycles: {dataset_info['total_cycles']}")
-        print(f"   Size: {dataset_info['file_size'] / 1024:.1f} KB")
-        print(f"   Sensors: {', '.join(dataset_info['sensors'][:3])}...")
+        print(f"   Name: {dataset_info.name}")
+        print(f"   Format: {dataset_info.file_format}")
+        print(f"   Cycles: {dataset_info.total_cycles}")
+        print(f"   Size: {dataset_info.file_size / 1024:.1f} KB")
+        print(f"   Sensors: {', '.join(dataset_info.sensors[:3])}...")
         print()
 
 
@@ -145,15 +145,15 @@ def example_6_deviations():
     print_section("Example 6: Deviation Detection Results")
     
     for deviation_key, deviation in MOCK_DEVIATIONS.items():
-        print(f"🔴 {deviation['sensor_name'].upper()} - {deviation['deviation_type'].upper()}")
-        print(f"   Severity: {deviation['severity']:.2f} (0-1 scale)")
-        print(f"   Compared to: {deviation['compared_to']}")
-        
-        if "time_start" in deviation and deviation["time_start"]:
-            duration = deviation.get("time_end", 0) - deviation.get("time_start", 0)
-            print(f"   Time window: {deviation['time_start']:.1f}s - {deviation['time_end']:.1f}s ({duration:.1f}s)")
-        
-        print(f"   Details: {deviation['details']['description']}")
+        print(f"🔴 {deviation.sensor_name.upper()} - {deviation.deviation_type.upper()}")
+        print(f"   Severity: {deviation.severity:.2f} (0-1 scale)")
+        print(f"   Compared to: {deviation.compared_to}")
+
+        if deviation.time_start is not None:
+            duration = (deviation.time_end or 0) - deviation.time_start
+            print(f"   Time window: {deviation.time_start:.1f}s - {deviation.time_end:.1f}s ({duration:.1f}s)")
+
+        print(f"   Details: {deviation.details['description']}")
         print()
 
 
@@ -222,7 +222,7 @@ async def start_cycle(stream_id: str, cycle_metadata: Optional[Dict] = Body(None
         return {
             "status": "ok",
             "cycle_id": fsm.current_cycle.cycle_id if fsm.current_cycle else None,
-            "state": fsm.state.value
+            "state": fsm.state.label
         }
     
     except Exception as e:
@@ -241,7 +241,7 @@ async def stop_cycle(stream_id: str):
         
         return {
             "status": "ok",
-            "state": fsm.state.value,
+            "state": fsm.state.label,
             "grace_period_sec": fsm.GRACE_PERIOD_SEC
         }
     
@@ -4,43 +4,65 @@ This file contains sample data structures that are compatible with the VerTac sy
 Used for unit tests, integration tests, and development.
 """
 
+import functools
 import json
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, List, Any
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Tuple
+
+import numpy as np
 
 # ============================================================================
 # MOCK DATASET DATA
 # ============================================================================
 
-MOCK_DATASETS = {
-    "test_dataset_1": {
-        "name": "Motor Speed Test Run 001",
-        "description": "High-speed motor operation test with normal operating conditions",
-        "file_format": "csv",
-        "file_size": 1024000,  # bytes
-        "upload_date": datetime.now() - timedelta(days=5),
-        "sensors": ["motor_speed", "voltage", "current", "temperature", "vibration"],
-        "total_cycles": 5,
-    },
-    "test_dataset_2": {
-        "name": "Pump Cycle Analysis",
-        "description": "Water pump operating cycles during peak load conditions",
-        "file_format": "xlsx",
-        "file_size": 2048000,
-        "upload_date": datetime.now() - timedelta(days=3),
-        "sensors": ["flow_rate", "pressure", "temperature", "power_consumption"],
-        "total_cycles": 8,
-    },
-    "test_dataset_3": {
-        "name": "Production Line Quality Check",
-        "description": "Manufacturing quality control measurements across 10 production cycles",
-        "file_format": "csv",
-        "file_size": 512000,
-        "upload_date": datetime.now() - timedelta(days=1),
-        "sensors": ["force", "displacement", "acceleration", "surface_temp"],
-        "total_cycles": 10,
-    },
-}
+@dataclass(frozen=True, slots=True)
+class MockDataset:
+    """Read-only mock dataset registry entry
+
+    Frozen slotted dataclass so field access is a slot load instead of
+    a nested dict lookup, and the registry contents can't be mutated by
+    tests.
+    """
+    name: str
+    description: str
+    file_format: str
+    file_size: int  # bytes
+    upload_date: datetime
+    sensors: Tuple[str, ...]
+    total_cycles: int
+
+
+MOCK_DATASETS: Mapping[str, MockDataset] = MappingProxyType({
+    "test_dataset_1": MockDataset(
+        name="Motor Speed Test Run 001",
+        description="High-speed motor operation test with normal operating conditions",
+        file_format="csv",
+        file_size=1024000,
+        upload_date=datetime.now() - timedelta(days=5),
+        sensors=("motor_speed", "voltage", "current", "temperature", "vibration"),
+        total_cycles=5,
+    ),
+    "test_dataset_2": MockDataset(
+        name="Pump Cycle Analysis",
+        description="Water pump operating cycles during peak load conditions",
+        file_format="xlsx",
+        file_size=2048000,
+        upload_date=datetime.now() - timedelta(days=3),
+        sensors=("flow_rate", "pressure", "temperature", "power_consumption"),
+        total_cycles=8,
+    ),
+    "test_dataset_3": MockDataset(
+        name="Production Line Quality Check",
+        description="Manufacturing quality control measurements across 10 production cycles",
+        file_format="csv",
+        file_size=512000,
+        upload_date=datetime.now() - timedelta(days=1),
+        sensors=("force", "displacement", "acceleration", "surface_temp"),
+        total_cycles=10,
+    ),
+})
 
 # ============================================================================
 # MOCK CYCLE DATA
@@ -81,31 +103,59 @@ def generate_mock_cycles(dataset_id: int, dataset_name: str, num_cycles: int = 5
 # MOCK SENSOR DATA (Time Series)
 # ============================================================================
 
+@dataclass
+class SensorSeries:
+    """Column-oriented sensor time series
+
+    Stores timestamps and values as NumPy arrays (one contiguous buffer per
+    column instead of one dict per point) while still behaving like the old
+    list-of-dicts: indexing returns a {timestamp, value, unit} dict, slicing
+    returns a SensorSeries, and iteration yields per-point dicts.
+    """
+    timestamps: np.ndarray
+    values: np.ndarray
+    unit: str
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return SensorSeries(self.timestamps[index], self.values[index], self.unit)
+        return {
+            "timestamp": float(self.timestamps[index]),
+            "value": float(self.values[index]),
+            "unit": self.unit,
+        }
+
+    def __iter__(self):
+        unit = self.unit
+        for timestamp, value in zip(self.timestamps.tolist(), self.values.tolist()):
+            yield {"timestamp": timestamp, "value": value, "unit": unit}
+
+
 def generate_mock_sensor_data(
     cycle_start: float,
     cycle_end: float,
     sensor_name: str,
     num_points: int = 200,
     is_anomalous: bool = False,
-) -> List[Dict[str, float]]:
+) -> SensorSeries:
     """
     Generate realistic time-series sensor data for a cycle
-    
+
     Args:
         cycle_start: Start time of cycle
         cycle_end: End time of cycle
         sensor_name: Name of the sensor
         num_points: Number of data points
         is_anomalous: Whether to add anomalous patterns
-    
+
     Returns:
-        List of sensor data points with timestamp and value
+        SensorSeries of sensor data points with timestamp and value
     """
-    import math
-    
-    data = []
     time_step = (cycle_end - cycle_start) / num_points
-    
+
     # Base patterns for different sensors
     sensor_patterns = {
         "motor_speed": {
@@ -189,96 +239,103 @@ def generate_mock_sensor_data(
         "unit": "unit",
     })
     
-    for i in range(num_points):
-        timestamp = cycle_start + (i * time_step)
-        
-        # Normal sine wave pattern
-        normalized_time = (i / num_points) * 2 * math.pi
-        value = (
-            pattern["baseline"] +
-            pattern["amplitude"] * math.sin(normalized_time * pattern["frequency"])
+    indices = np.arange(num_points)
+    timestamps = cycle_start + indices * time_step
+
+    # Normal sine wave pattern
+    normalized_time = (indices / num_points) * 2 * np.pi
+    values = (
+        pattern["baseline"] +
+        pattern["amplitude"] * np.sin(normalized_time * pattern["frequency"])
+    )
+
+    # Add noise
+    values += np.random.default_rng().normal(0, pattern["amplitude"] * 0.05, num_points)
+
+    # Add anomaly if flagged
+    if is_anomalous:
+        # Spike in last third of cycle
+        spike_mask = indices > num_points * 0.65
+        values[spike_mask] += pattern["amplitude"] * 0.8 * np.sin(
+            (indices[spike_mask] - num_points * 0.65) / (num_points * 0.35) * np.pi
         )
-        
-        # Add noise
-        import random
-        noise = random.gauss(0, pattern["amplitude"] * 0.05)
-        value += noise
-        
-        # Add anomaly if flagged
-        if is_anomalous:
-            # Spike in last third of cycle
-            if i > num_points * 0.65:
-                anomaly_spike = pattern["amplitude"] * 0.8 * math.sin(
-                    (i - num_points * 0.65) / (num_points * 0.35) * math.pi
-                )
-                value += anomaly_spike
-        
-        data.append({
-            "timestamp": round(timestamp, 3),
-            "value": round(value, 2),
-            "unit": pattern["unit"],
-        })
-    
-    return data
+
+    return SensorSeries(
+        timestamps=np.round(timestamps, 3),
+        values=np.round(values, 2),
+        unit=pattern["unit"],
+    )
 
 # ============================================================================
 # MOCK DEVIATIONS DATA
 # ============================================================================
 
-MOCK_DEVIATIONS = {
-    "amplitude_deviation": {
-        "sensor_name": "motor_speed",
-        "deviation_type": "amplitude",
-        "severity": 0.72,
-        "compared_to": "reference",
-        "time_start": 85.2,
-        "time_end": 110.5,
-        "details": {
+@dataclass(frozen=True, slots=True)
+class MockDeviation:
+    """Read-only mock deviation registry entry"""
+    sensor_name: str
+    deviation_type: str
+    severity: float
+    compared_to: str
+    details: Dict[str, Any] = field(default_factory=dict)
+    time_start: Optional[float] = None
+    time_end: Optional[float] = None
+
+
+MOCK_DEVIATIONS: Mapping[str, MockDeviation] = MappingProxyType({
+    "amplitude_deviation": MockDeviation(
+        sensor_name="motor_speed",
+        deviation_type="amplitude",
+        severity=0.72,
+        compared_to="reference",
+        time_start=85.2,
+        time_end=110.5,
+        details={
             "reference_value": 1500,
             "actual_value": 1620,
             "deviation_percent": 8.0,
             "description": "Motor speed exceeded nominal value by 8%",
         },
-    },
-    "shape_deviation": {
-        "sensor_name": "voltage",
-        "deviation_type": "shape",
-        "severity": 0.45,
-        "compared_to": "reference",
-        "time_start": 30.1,
-        "time_end": 95.8,
-        "details": {
+    ),
+    "shape_deviation": MockDeviation(
+        sensor_name="voltage",
+        deviation_type="shape",
+        severity=0.45,
+        compared_to="reference",
+        time_start=30.1,
+        time_end=95.8,
+        details={
             "correlation_coefficient": 0.82,
             "description": "Voltage waveform shape differs significantly from reference",
             "euclidean_distance": 45.3,
         },
-    },
-    "timing_deviation": {
-        "sensor_name": "temperature",
-        "deviation_type": "timing",
-        "severity": 0.38,
-        "compared_to": "previous",
-        "time_start": 40.0,
-        "time_end": 80.0,
-        "details": {
+    ),
+    "timing_deviation": MockDeviation(
+        sensor_name="temperature",
+        deviation_type="timing",
+        severity=0.38,
+        compared_to="previous",
+        time_start=40.0,
+        time_end=80.0,
+        details={
             "reference_peak_time": 60.5,
             "actual_peak_time": 52.3,
             "time_shift_seconds": -8.2,
             "description": "Temperature peak occurred 8.2 seconds earlier than reference",
         },
-    },
-    "overall_deviation": {
-        "sensor_name": "current",
-        "deviation_type": "overall",
-        "severity": 0.65,
-        "compared_to": "reference",
-        "details": {
+    ),
+    "overall_deviation": MockDeviation(
+        sensor_name="current",
+        deviation_type="overall",
+        severity=0.65,
+        compared_to="reference",
+        details={
             "rms_difference": 12.5,
             "max_delta": 24.3,
             "description": "Current profile shows significant overall deviation",
         },
-    },
-}
+    ),
+})
 
 # ============================================================================
 # MOCK ANALYSIS RESULTS
@@ -356,38 +413,46 @@ MOCK_ANALYSIS_RESULTS = {
 # HELPER FUNCTIONS FOR TEST DATA
 # ============================================================================
 
-def get_mock_dataset(dataset_key: str = "test_dataset_1") -> Dict[str, Any]:
-    """Get a complete mock dataset with all related data"""
-    if dataset_key not in MOCK_DATASETS:
-        raise ValueError(f"Unknown dataset key: {dataset_key}")
-    
+@functools.lru_cache(maxsize=256)
+def _get_mock_dataset_cached(dataset_key: str) -> Dict[str, Any]:
+    """Build a mock dataset; memoized since generation is pure"""
     dataset_info = MOCK_DATASETS[dataset_key]
     dataset_id = list(MOCK_DATASETS.keys()).index(dataset_key) + 1
-    
+
     return {
         "dataset": {
             "id": dataset_id,
-            **dataset_info,
+            **asdict(dataset_info),
         },
         "cycles": generate_mock_cycles(
             dataset_id,
             dataset_key,
-            dataset_info["total_cycles"],
+            dataset_info.total_cycles,
         ),
     }
 
-def get_mock_cycle_with_data(
-    cycle_number: int = 1,
-    is_anomalous: bool = False,
-    sensors: List[str] = None,
+def get_mock_dataset(dataset_key: str = "test_dataset_1") -> Dict[str, Any]:
+    """Get a complete mock dataset with all related data"""
+    if dataset_key not in MOCK_DATASETS:
+        raise ValueError(f"Unknown dataset key: {dataset_key}")
+
+    cached = _get_mock_dataset_cached(dataset_key)
+    # Shallow-copy the top-level dicts so callers can't mutate the cache
+    return {
+        "dataset": dict(cached["dataset"]),
+        "cycles": cached["cycles"],
+    }
+
+@functools.lru_cache(maxsize=256)
+def _get_mock_cycle_cached(
+    cycle_number: int,
+    is_anomalous: bool,
+    sensors: tuple,
 ) -> Dict[str, Any]:
-    """Get a complete mock cycle with sensor data"""
-    if sensors is None:
-        sensors = ["motor_speed", "voltage", "current", "temperature"]
-    
+    """Build a mock cycle with sensor data; memoized since generation is pure"""
     start_time = (cycle_number - 1) * 120.0
     end_time = start_time + 118.5
-    
+
     sensor_data = {}
     for sensor in sensors:
         sensor_data[sensor] = generate_mock_sensor_data(
@@ -397,7 +462,7 @@ def get_mock_cycle_with_data(
             num_points=200,
             is_anomalous=is_anomalous,
         )
-    
+
     return {
         "cycle": {
             "cycle_number": cycle_number,
@@ -409,6 +474,22 @@ def get_mock_cycle_with_data(
         "sensor_data": sensor_data,
     }
 
+def get_mock_cycle_with_data(
+    cycle_number: int = 1,
+    is_anomalous: bool = False,
+    sensors: List[str] = None,
+) -> Dict[str, Any]:
+    """Get a complete mock cycle with sensor data"""
+    if sensors is None:
+        sensors = ["motor_speed", "voltage", "current", "temperature"]
+
+    # Normalize the sensors list to a hashable tuple for the cache
+    cached = _get_mock_cycle_cached(cycle_number, is_anomalous, tuple(sensors))
+    return {
+        "cycle": dict(cached["cycle"]),
+        "sensor_data": dict(cached["sensor_data"]),
+    }
+
 def get_all_mock_data() -> Dict[str, Any]:
     """Get all mock data structured together"""
     return {
@@ -432,11 +513,11 @@ if __name__ == "__main__":
     # Example: Get cycle with sensor data
     cycle_data = get_mock_cycle_with_data(cycle_number=1, is_anomalous=False)
     print("\n\nCycle with Sensor Data:")
-    print(json.dumps(cycle_data, indent=2))
+    print(json.dumps(cycle_data, indent=2, default=list))
     
     # Example: Get deviations
     print("\n\nMock Deviations:")
-    print(json.dumps(MOCK_DEVIATIONS, indent=2))
+    print(json.dumps({key: asdict(dev) for key, dev in MOCK_DEVIATIONS.items()}, indent=2))
     
     # Example: Get analysis results
     print("\n\nMock Analysis Results:")
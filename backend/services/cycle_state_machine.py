@@ -2,34 +2,52 @@
 Cycle State Machine for real-time monitoring
 """
 
-from enum import Enum
+from enum import IntEnum
 from datetime import datetime, timedelta
 from typing import Optional, Callable, Dict, Any
 from dataclasses import dataclass, field
 import uuid
 
 
-class CycleState(str, Enum):
-    """Cycle states"""
-    IDLE = "idle"
-    WAITING_START = "waiting_start"
-    ACTIVE = "active"
-    STOPPING = "stopping"
-    STOPPED = "stopped"
-    ABORTED = "aborted"
+class CycleState(IntEnum):
+    """Cycle states
 
+    IntEnum so the per-sample comparisons in transition() are C-level
+    integer compares; use .label for the wire-format string.
+    """
+    IDLE = 0
+    WAITING_START = 1
+    ACTIVE = 2
+    STOPPING = 3
+    STOPPED = 4
+    ABORTED = 5
 
-class CycleEvent(str, Enum):
+    @property
+    def label(self) -> str:
+        """Lowercase string name as exposed in API responses"""
+        return self.name.lower()
+
+
+class CycleEvent(IntEnum):
     """Cycle events"""
-    REGISTER_STREAM = "register_stream"
-    CYCLE_START = "cycle_start"
-    CYCLE_STOP = "cycle_stop"
-    CYCLE_PAUSE = "cycle_pause"
-    CYCLE_RESUME = "cycle_resume"
-    SAMPLE_RECEIVED = "sample_received"
-    CONNECTION_LOST = "connection_lost"
-    TIMEOUT = "timeout"
-    MANUAL_ABORT = "manual_abort"
+    REGISTER_STREAM = 0
+    CYCLE_START = 1
+    CYCLE_STOP = 2
+    CYCLE_PAUSE = 3
+    CYCLE_RESUME = 4
+    SAMPLE_RECEIVED = 5
+    CONNECTION_LOST = 6
+    TIMEOUT = 7
+    MANUAL_ABORT = 8
+
+
+# Bitmask membership tests for the multi-state checks in transition()
+_STARTABLE_MASK = (
+    (1 << CycleState.WAITING_START)
+    | (1 << CycleState.STOPPED)
+    | (1 << CycleState.ABORTED)
+)
+_RUNNING_MASK = (1 << CycleState.ACTIVE) | (1 << CycleState.STOPPING)
 
 
 @dataclass
@@ -49,6 +67,11 @@ class CycleMetadata:
     custom_metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+def _noop(*_args, **_kwargs) -> None:
+    """Default callback - lets hot paths call unconditionally"""
+    pass
+
+
 class CycleStateMachine:
     """Manages cycle state transitions"""
     
@@ -66,10 +89,11 @@ class CycleStateMachine:
         self.last_sample_time: Optional[datetime] = None
         self.stop_time: Optional[datetime] = None
         
-        # Callbacks
-        self.on_state_change: Optional[Callable] = None
-        self.on_cycle_complete: Optional[Callable] = None
-        self.on_error: Optional[Callable] = None
+        # Callbacks - default to a no-op so the per-event paths can call
+        # them unconditionally instead of branching on truthiness
+        self.on_state_change: Callable = _noop
+        self.on_cycle_complete: Callable = _noop
+        self.on_error: Callable = _noop
     
     def transition(self, event: CycleEvent, metadata: Optional[Dict[str, Any]] = None) -> bool:
         """Process event and transition state"""
@@ -81,7 +105,7 @@ class CycleStateMachine:
                     self.state = CycleState.WAITING_START
             
             elif event == CycleEvent.CYCLE_START:
-                if self.state in [CycleState.WAITING_START, CycleState.STOPPED, CycleState.ABORTED]:
+                if (1 << self.state) & _STARTABLE_MASK:
                     self.state = CycleState.ACTIVE
                     self._start_new_cycle(metadata or {})
             
@@ -133,33 +157,34 @@ class CycleStateMachine:
                         self._complete_cycle()
             
             elif event == CycleEvent.CONNECTION_LOST:
-                if self.state in [CycleState.ACTIVE, CycleState.STOPPING]:
+                if (1 << self.state) & _RUNNING_MASK:
                     self.state = CycleState.ABORTED
                     if self.current_cycle:
                         self.current_cycle.abort_reason = "connection_lost"
                     self._complete_cycle()
             
             elif event == CycleEvent.MANUAL_ABORT:
-                if self.state in [CycleState.ACTIVE, CycleState.STOPPING]:
+                if (1 << self.state) & _RUNNING_MASK:
                     self.state = CycleState.ABORTED
                     if self.current_cycle:
                         self.current_cycle.abort_reason = "manual_abort"
                     self._complete_cycle()
             
-            # Notify on state change
-            if old_state != self.state and self.on_state_change:
+            # Notify on state change - pass the string labels, since the
+            # callback kwargs go over the wire verbatim and clients match
+            # on the state names
+            if old_state != self.state:
                 self.on_state_change(
                     stream_id=self.stream_id,
-                    old_state=old_state,
-                    new_state=self.state,
+                    old_state=old_state.label,
+                    new_state=self.state.label,
                     cycle_id=self.current_cycle.cycle_id if self.current_cycle else None
                 )
             
             return True
         
         except Exception as e:
-            if self.on_error:
-                self.on_error(f"State transition error: {e}")
+            self.on_error(f"State transition error: {e}")
             return False
     
     def _start_new_cycle(self, metadata: Dict[str, Any]) -> None:
@@ -187,9 +212,7 @@ class CycleStateMachine:
         """Mark cycle as complete"""
         if self.current_cycle:
             self.current_cycle.end_time = datetime.utcnow()
-            
-            if self.on_cycle_complete:
-                self.on_cycle_complete(self.current_cycle)
+            self.on_cycle_complete(self.current_cycle)
     
     def check_sample_timeout(self) -> None:
         """Periodically check for sample timeout"""
@@ -206,7 +229,7 @@ class CycleStateMachine:
         """Get current state status"""
         return {
             "stream_id": self.stream_id,
-            "state": self.state.value,
+            "state": self.state.label,
             "cycle_id": self.current_cycle.cycle_id if self.current_cycle else None,
             "cycle_number": self.current_cycle.cycle_number if self.current_cycle else None,
             "start_time": self.current_cycle.start_time.isoformat() if self.current_cycle else None,
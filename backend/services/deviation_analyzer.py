@@ -5,10 +5,11 @@ Real-time deviation analysis pipeline for completed cycles
 from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
 import numpy as np
-from scipy import signal
-from scipy.spatial.distance import euclidean
 import logging
 
+# scipy is imported lazily inside the methods that need it (~200ms cold
+# import) so workers that never analyze cycles don't pay for it at startup
+
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +50,14 @@ class DeviationAnalyzer:
     def __init__(self):
         self.anomaly_threshold = 0.7  # Deviation score threshold for anomaly
         self.warning_threshold = 0.5
+        # Smoothed reference signals keyed by (reference_cycle_id, sensor_id).
+        # The reference is static across many completed cycles, so smoothing
+        # it once per reference/sensor pair avoids repeated savgol passes.
+        self._ref_cache: Dict[Tuple[str, str], np.ndarray] = {}
+        # Reusable DTW row buffers, grown geometrically as needed so the
+        # per-call cost-matrix allocation is amortized away
+        self._dtw_row_prev = np.empty(256, dtype=np.float32)
+        self._dtw_row_curr = np.empty(256, dtype=np.float32)
     
     def normalize_signal(self, values: np.ndarray) -> np.ndarray:
         """Normalize signal to 0-1 range"""
@@ -67,9 +76,13 @@ class DeviationAnalyzer:
         """Apply Savitzky-Golay filter for smoothing"""
         if len(values) < window_length:
             return values
-        
+
+        from scipy.signal import savgol_filter
+
         try:
-            return signal.savgol_filter(values, window_length, polyorder=3)
+            smoothed = savgol_filter(values, window_length, polyorder=3)
+            # savgol promotes to float64; keep the caller's dtype
+            return smoothed.astype(values.dtype, copy=False)
         except:
             return values
     
@@ -79,6 +92,8 @@ class DeviationAnalyzer:
         reference_values: np.ndarray
     ) -> float:
         """Calculate Euclidean distance between signals"""
+        from scipy.spatial.distance import euclidean
+
         # Ensure same length
         min_len = min(len(completed_values), len(reference_values))
         completed_values = completed_values[:min_len]
@@ -94,9 +109,17 @@ class DeviationAnalyzer:
     def dtw_distance(
         self,
         completed_values: np.ndarray,
-        reference_values: np.ndarray
+        reference_values: np.ndarray,
+        band_width: int = 0
     ) -> float:
-        """Calculate Dynamic Time Warping distance"""
+        """Calculate Dynamic Time Warping distance
+
+        Restricted to a Sakoe-Chiba band (default 10% of signal length,
+        at least 50 samples). Industrial cycles are well aligned, so
+        warping paths far off the diagonal are not physically meaningful;
+        the band cuts the cost from O(n*m) to O(n*w) with no accuracy
+        loss for such signals.
+        """
         # Ensure same length by interpolation
         if len(completed_values) != len(reference_values):
             from scipy.interpolate import interp1d
@@ -108,28 +131,40 @@ class DeviationAnalyzer:
             f_completed = interp1d(x_completed, completed_values, kind='linear', fill_value='extrapolate')
             f_reference = interp1d(x_reference, reference_values, kind='linear', fill_value='extrapolate')
             
-            completed_values = f_completed(x_common)
-            reference_values = f_reference(x_common)
+            completed_values = f_completed(x_common).astype(np.float32, copy=False)
+            reference_values = f_reference(x_common).astype(np.float32, copy=False)
         
         # Normalize
         completed_norm = self.normalize_signal(completed_values)
         reference_norm = self.normalize_signal(reference_values)
         
-        # DTW calculation (simplified)
+        # DTW calculation (simplified, band-restricted)
         n, m = len(completed_norm), len(reference_norm)
-        dtw_matrix = np.full((n + 1, m + 1), np.inf)
-        dtw_matrix[0, 0] = 0
-        
+        if band_width <= 0:
+            band_width = max(50, int(0.1 * max(n, m)))
+        # The band must cover the length difference to stay feasible
+        band_width = max(band_width, abs(n - m))
+
+        # Only two rows of the cost matrix are live at a time; reuse the
+        # instance buffers instead of allocating (n+1)x(m+1) per call
+        if self._dtw_row_prev.size < m + 1:
+            new_size = max(m + 1, self._dtw_row_prev.size * 2)
+            self._dtw_row_prev = np.empty(new_size, dtype=np.float32)
+            self._dtw_row_curr = np.empty(new_size, dtype=np.float32)
+
+        prev = self._dtw_row_prev[:m + 1]
+        curr = self._dtw_row_curr[:m + 1]
+        prev.fill(np.inf)
+        prev[0] = 0.0
+
         for i in range(1, n + 1):
-            for j in range(1, m + 1):
+            curr.fill(np.inf)
+            for j in range(max(1, i - band_width), min(m + 1, i + band_width + 1)):
                 cost = abs(completed_norm[i-1] - reference_norm[j-1])
-                dtw_matrix[i, j] = cost + min(
-                    dtw_matrix[i-1, j],
-                    dtw_matrix[i, j-1],
-                    dtw_matrix[i-1, j-1]
-                )
-        
-        return float(dtw_matrix[n, m])
+                curr[j] = cost + min(prev[j], curr[j-1], prev[j-1])
+            prev, curr = curr, prev
+
+        return float(prev[m])
     
     def compute_deviation_metrics(
         self,
@@ -156,15 +191,27 @@ class DeviationAnalyzer:
         sensor_id: str,
         sensor_name: str,
         completed_values: List[float],
-        reference_values: List[float]
+        reference_values: List[float],
+        reference_cycle_id: Optional[str] = None
     ) -> SensorDeviation:
         """Analyze a single sensor's deviation"""
-        completed_array = np.array(completed_values)
-        reference_array = np.array(reference_values)
-        
-        # Smooth both signals
+        # float32 throughout - sensor readings don't need float64 precision,
+        # and halving the element size doubles SIMD throughput on the
+        # distance/deviation passes
+        completed_array = np.asarray(completed_values, dtype=np.float32)
+        reference_array = np.asarray(reference_values, dtype=np.float32)
+
+        # Smooth both signals (reference smoothing is cached per cycle/sensor)
         completed_smooth = self.smooth_signal(completed_array)
-        reference_smooth = self.smooth_signal(reference_array)
+
+        if reference_cycle_id is not None:
+            cache_key = (reference_cycle_id, sensor_id)
+            reference_smooth = self._ref_cache.get(cache_key)
+            if reference_smooth is None:
+                reference_smooth = self.smooth_signal(reference_array)
+                self._ref_cache[cache_key] = reference_smooth
+        else:
+            reference_smooth = self.smooth_signal(reference_array)
         
         # Compute distances
         euclidean_dist = self.euclidean_distance(completed_smooth, reference_smooth)
@@ -219,15 +266,21 @@ class DeviationAnalyzer:
                 sensor_id=sensor_id,
                 sensor_name=sensor_id,  # Would get from metadata
                 completed_values=values,
-                reference_values=reference_samples[sensor_id]
+                reference_values=reference_samples[sensor_id],
+                reference_cycle_id=reference_cycle_id
             )
             sensor_deviations.append(deviation)
         
-        # Rank sensors by contribution
-        sensor_deviations.sort(
-            key=lambda x: x.euclidean_distance + x.dtw_distance,
-            reverse=True
-        )
+        # Rank sensors by contribution (argsort on a flat score array
+        # instead of a keyed Python sort - one attribute pass per sensor)
+        if sensor_deviations:
+            scores = np.fromiter(
+                (d.euclidean_distance + d.dtw_distance for d in sensor_deviations),
+                dtype=np.float32,
+                count=len(sensor_deviations)
+            )
+            order = np.argsort(-scores, kind='stable')
+            sensor_deviations = [sensor_deviations[i] for i in order]
         for i, deviation in enumerate(sensor_deviations, 1):
             deviation.contribution_rank = i
         
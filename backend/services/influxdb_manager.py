@@ -4,15 +4,23 @@ InfluxDB client and utilities for time-series data
 
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
+from dataclasses import dataclass
 import asyncio
+import json
 
 from influxdb_client import InfluxDBClient
 from influxdb_client.client.write_api import SYNCHRONOUS, ASYNCHRONOUS
-from pydantic import BaseModel
 
 
-class SamplePoint(BaseModel):
-    """Time-series sample point"""
+@dataclass(slots=True)
+class SamplePoint:
+    """Time-series sample point
+
+    Plain slotted dataclass rather than a pydantic model - sample points
+    are constructed per sample on the ingestion hot path, where pydantic's
+    per-field validation is the dominant cost. Incoming samples are already
+    validated at the API boundary.
+    """
     timestamp: str
     sensor_id: str
     sensor_name: str
@@ -41,6 +49,14 @@ class InfluxDBManager:
         self.client = InfluxDBClient(url=url, token=token, org=org)
         self.write_api = self.client.write_api(write_type=SYNCHRONOUS)
         self.query_api = self.client.query_api()
+
+        # Static query fragments built once - queries are issued on every poll,
+        # so keep the per-call string work down to the dynamic filters only
+        self._cycle_query_prefix = (
+            f'from(bucket: "{self.bucket}")'
+            ' |> range(start: -7d)'
+            ' |> filter(fn: (r) => r["_measurement"] == "sensor_readings")'
+        )
     
     def write_samples(self, samples: List[SamplePoint]) -> bool:
         """Write samples to InfluxDB"""
@@ -78,35 +94,51 @@ class InfluxDBManager:
     ) -> Dict[str, List[Dict[str, Any]]]:
         """Query samples for a cycle"""
         try:
-            query = f'''
-                from(bucket: "{self.bucket}")
-                |> range(start: -7d)
-                |> filter(fn: (r) => r["_measurement"] == "sensor_readings")
-                |> filter(fn: (r) => r["cycle_id"] == "{cycle_id}")
-            '''
-            
+            parts = [
+                self._cycle_query_prefix,
+                f'|> filter(fn: (r) => r["cycle_id"] == "{cycle_id}")',
+            ]
+
             if sensor_ids:
-                sensor_filter = ' or '.join([f'r["sensor_id"] == "{sid}"' for sid in sensor_ids])
-                query += f'|> filter(fn: (r) => {sensor_filter})'
-            
-            query += '|> sort(columns: ["_time"])'
-            
-            result = self.query_api.query(query=query)
-            
-            samples_by_sensor = {}
-            for table in result:
-                for record in table.records:
-                    sensor_id = record.tags.get("sensor_id", "unknown")
-                    if sensor_id not in samples_by_sensor:
-                        samples_by_sensor[sensor_id] = []
-                    
-                    samples_by_sensor[sensor_id].append({
-                        "timestamp": record.get_time().isoformat(),
-                        "value": record.get_value(),
-                        "quality": record.values.get("quality", 1.0),
-                    })
+                # Single contains() filter instead of one predicate per
+                # sensor; json.dumps emits the double-quoted string
+                # literals Flux requires
+                sensor_set = json.dumps(list(sensor_ids))
+                parts.append(
+                    f'|> filter(fn: (r) => contains(value: r["sensor_id"], set: {sensor_set}))'
+                )
+
+            parts.append('|> sort(columns: ["_time"])')
+            query = ' '.join(parts)
             
-            return samples_by_sensor
+            # Stream records instead of materializing the full FluxTable graph;
+            # memory stays O(batch) even for very large cycles
+            records = self.query_api.query_stream(query=query)
+
+            columns_by_sensor: Dict[str, List[tuple]] = {}
+            for record in records:
+                sensor_id = record.values.get("sensor_id", "unknown")
+                if sensor_id not in columns_by_sensor:
+                    columns_by_sensor[sensor_id] = []
+
+                columns_by_sensor[sensor_id].append((
+                    record.get_time(),
+                    record.get_value(),
+                    record.values.get("quality", 1.0),
+                ))
+
+            # Build the dict representation only at the return boundary
+            return {
+                sensor_id: [
+                    {
+                        "timestamp": timestamp.isoformat(),
+                        "value": value,
+                        "quality": quality,
+                    }
+                    for timestamp, value, quality in rows
+                ]
+                for sensor_id, rows in columns_by_sensor.items()
+            }
         except Exception as e:
             print(f"❌ Query error: {e}")
             return {}
@@ -2,16 +2,61 @@
 Test script to verify backend setup and imports
 """
 
+import hashlib
+import os
 import sys
 from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent))
+# Backend directory, resolved once; repeated sys.path inserts invalidate
+# the import system's path caches, so only add it if it's not there yet
+_HERE = Path(__file__).resolve().parent
+if str(_HERE) not in sys.path:
+    sys.path.insert(0, str(_HERE))
+
+# Marker files recording the last successful check, keyed by a content
+# hash so source changes invalidate them; validate_system.py shares these
+CACHE_DIR = _HERE / ".cache"
+
+
+def source_hash() -> str:
+    """Content hash of the backend sources covered by the import check"""
+    digest = hashlib.sha1()
+    for path in sorted(_HERE.glob("app/**/*.py")):
+        digest.update(path.read_bytes())
+    main_py = _HERE / "main.py"
+    if main_py.exists():
+        digest.update(main_py.read_bytes())
+    return digest.hexdigest()
+
+
+def check_marker(name: str, key: str) -> bool:
+    """True if a cached marker matches the key (skipped in CI)"""
+    if os.getenv("CI") == "1":
+        return False
+    marker = CACHE_DIR / name
+    try:
+        return marker.read_text() == key
+    except OSError:
+        return False
+
+
+def write_marker(name: str, key: str) -> None:
+    """Record a successful check result"""
+    CACHE_DIR.mkdir(exist_ok=True)
+    (CACHE_DIR / name).write_text(key)
+
 
 def test_imports():
     """Test that all critical imports work"""
     print("Testing imports...")
-    
+
+    # Importing main builds the full FastAPI app - skip when the sources
+    # haven't changed since the last successful run
+    key = source_hash()
+    if check_marker("imports_ok", key):
+        print("✓ Imports unchanged since last successful check (cached)")
+        return True
+
     try:
         # Core imports
         from app.core.config import settings
@@ -45,6 +90,7 @@ def test_imports():
         print("✓ Main app imported")
         
         print("\n✅ All imports successful!")
+        write_marker("imports_ok", key)
         return True
         
     except ImportError as e:
@@ -77,7 +123,18 @@ def test_config():
 def check_dependencies():
     """Check required packages"""
     print("\nChecking dependencies...")
-    
+
+    # Importing the scientific stack just to probe presence is slow -
+    # reuse the last result while the interpreter and pins are unchanged
+    requirements = _HERE / "requirements.txt"
+    deps_key = hashlib.sha1(
+        sys.version.encode() +
+        (requirements.read_bytes() if requirements.exists() else b"")
+    ).hexdigest()
+    if check_marker("deps_ok", deps_key):
+        print("✓ Dependencies unchanged since last successful check (cached)")
+        return True
+
     required_packages = [
         'fastapi',
         'uvicorn',
@@ -88,13 +145,21 @@ def check_dependencies():
         'numpy',
         'scipy',
     ]
-    
+
+    # Import names whose installed distribution is named differently
+    dist_names = {'pydantic_settings': 'pydantic-settings'}
+
+    # Check installed-distribution metadata instead of importing - an
+    # actual import of pandas/scipy runs their full initialization just
+    # to prove presence
+    from importlib.metadata import PackageNotFoundError, distribution
+
     missing = []
     for package in required_packages:
         try:
-            __import__(package)
+            distribution(dist_names.get(package, package))
             print(f"✓ {package}")
-        except ImportError:
+        except PackageNotFoundError:
             print(f"❌ {package} - MISSING")
             missing.append(package)
     
@@ -104,6 +169,7 @@ def check_dependencies():
         return False
     else:
         print("\n✅ All dependencies installed")
+        write_marker("deps_ok", deps_key)
         return True
 
 
@@ -3,12 +3,49 @@ Comprehensive system validation script
 Tests all major components and integrations
 """
 
+import functools
 import sys
 import os
 from pathlib import Path
 
-# Add to path
-sys.path.insert(0, str(Path(__file__).parent))
+# Backend directory, resolved once; only touch sys.path when the entry
+# is actually missing since each insert invalidates importer caches
+_HERE = Path(__file__).resolve().parent
+if str(_HERE) not in sys.path:
+    sys.path.insert(0, str(_HERE))
+
+
+@functools.cache
+def _backend_modules():
+    """Import the heavy app modules once, shared by all validators
+
+    The model/schema/service/endpoint checks all need the same module
+    chain, which transitively pulls in pandas/scipy; importing it once
+    and handing out references keeps that cost to a single cold import.
+    """
+    from types import SimpleNamespace
+
+    from app.core import database
+    from app.models import models
+    from app.api.v1 import router
+    from app.api.v1.endpoints import analysis, cycles, datasets
+    from app.schemas import analysis as analysis_schemas
+    from app.schemas import cycle as cycle_schemas
+    from app.schemas import dataset as dataset_schemas
+    from app.services import analysis_service, cycle_service, dataset_service
+
+    return SimpleNamespace(
+        database=database,
+        models=models,
+        router=router,
+        endpoints=SimpleNamespace(analysis=analysis, cycles=cycles, datasets=datasets),
+        schemas=SimpleNamespace(
+            analysis=analysis_schemas, cycle=cycle_schemas, dataset=dataset_schemas
+        ),
+        services=SimpleNamespace(
+            analysis=analysis_service, cycle=cycle_service, dataset=dataset_service
+        ),
+    )
 
 
 def validate_file_structure():
@@ -51,45 +88,81 @@ def validate_file_structure():
     }
     
     all_ok = True
-    backend_dir = Path(__file__).parent
-    
+
     for component, files in required_files.items():
-        component_dir = backend_dir.parent / component if component == 'frontend' else backend_dir
+        component_dir = _HERE.parent / component if component == 'frontend' else _HERE
         print(f"\n  Checking {component}:")
-        
+
+        # One directory walk per component instead of a stat() per file
+        present = _relative_file_set(component_dir)
+
         for file in files:
-            file_path = component_dir / file
-            if file_path.exists():
+            if file in present:
                 print(f"    ✓ {file}")
             else:
                 print(f"    ❌ {file} - MISSING")
                 all_ok = False
-    
+
     return all_ok
 
 
+def _relative_file_set(base: Path) -> set:
+    """Collect relative paths of all files under base, pruning heavy dirs"""
+    present = set()
+    for root, dirs, names in os.walk(base):
+        dirs[:] = [d for d in dirs if d not in _SKIP_DIRS]
+        rel_root = os.path.relpath(root, base)
+        for name in names:
+            present.add(name if rel_root == '.' else os.path.join(rel_root, name))
+    return present
+
+
+# Directories pruned during the syntax sweep
+_SKIP_DIRS = {'venv', '.venv', '__pycache__', 'node_modules', '.git'}
+
+
+def _check_syntax(file):
+    """Syntax-check one file; returns (file, error or None)"""
+    try:
+        # Read raw bytes in one syscall and hand them straight to
+        # compile() - the tokenizer decodes once, honoring any PEP-263
+        # coding declaration, with no intermediate str
+        fd = os.open(file, os.O_RDONLY)
+        try:
+            data = os.read(fd, os.fstat(fd).st_size)
+        finally:
+            os.close(fd)
+        compile(data, file, 'exec', dont_inherit=True, optimize=2)
+        return file, None
+    except SyntaxError as e:
+        return file, str(e)
+
+
 def validate_python_syntax():
     """Check Python files for syntax errors"""
     print("\n🐍 Validating Python Syntax...")
-    
-    import ast
-    import glob
-    
-    python_files = glob.glob('**/*.py', recursive=True)
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Collect files with os.walk, pruning skipped dirs in place rather
+    # than string-matching every path afterwards
+    python_files = []
+    for root, dirs, names in os.walk('.'):
+        dirs[:] = [d for d in dirs if d not in _SKIP_DIRS]
+        python_files.extend(
+            os.path.join(root, name) for name in names if name.endswith('.py')
+        )
+
+    # Parsing is CPU-bound and independent per file - fan out to a pool
     errors = []
-    
-    for file in python_files:
-        if 'venv' in file or '__pycache__' in file:
-            continue
-        
-        try:
-            with open(file, 'r') as f:
-                ast.parse(f.read())
-            print(f"  ✓ {file}")
-        except SyntaxError as e:
-            print(f"  ❌ {file}: {e}")
-            errors.append((file, str(e)))
-    
+    with ProcessPoolExecutor() as pool:
+        for file, error in pool.map(_check_syntax, python_files, chunksize=16):
+            if error is None:
+                print(f"  ✓ {file}")
+            else:
+                print(f"  ❌ {file}: {error}")
+                errors.append((file, error))
+
     if errors:
         print(f"\n❌ Found {len(errors)} syntax errors")
         return False
@@ -103,11 +176,10 @@ def validate_database_models():
     print("\n💾 Validating Database Models...")
     
     try:
-        from app.models.models import Dataset, Cycle, Deviation
-        from app.core.database import Base
-        
+        mods = _backend_modules()
+
         # Check that models are registered
-        tables = Base.metadata.tables
+        tables = mods.database.Base.metadata.tables
         
         required_tables = ['datasets', 'cycles', 'deviations']
         for table_name in required_tables:
@@ -131,19 +203,17 @@ def validate_api_endpoints():
     print("\n🌐 Validating API Endpoints...")
     
     try:
-        from app.api.v1.router import api_router
-        
+        mods = _backend_modules()
+
         # Count routes
-        route_count = len(api_router.routes)
+        route_count = len(mods.router.api_router.routes)
         print(f"  Found {route_count} routes")
-        
+
         # Check endpoint modules
-        from app.api.v1.endpoints import datasets, cycles, analysis
-        
         modules = [
-            ('datasets', datasets),
-            ('cycles', cycles),
-            ('analysis', analysis),
+            ('datasets', mods.endpoints.datasets),
+            ('cycles', mods.endpoints.cycles),
+            ('analysis', mods.endpoints.analysis),
         ]
         
         for name, module in modules:
@@ -169,16 +239,16 @@ def validate_schemas():
     print("\n📋 Validating Schemas...")
     
     try:
-        from app.schemas import dataset, cycle, analysis
-        
+        mods = _backend_modules()
+
         # Test schema imports
         schemas = [
-            ('DatasetCreate', dataset.DatasetCreate),
-            ('DatasetResponse', dataset.DatasetResponse),
-            ('CycleResponse', cycle.CycleResponse),
-            ('CycleDetailResponse', cycle.CycleDetailResponse),
-            ('ComparisonResponse', analysis.ComparisonResponse),
-            ('DeviationAnalysisResponse', analysis.DeviationAnalysisResponse),
+            ('DatasetCreate', mods.schemas.dataset.DatasetCreate),
+            ('DatasetResponse', mods.schemas.dataset.DatasetResponse),
+            ('CycleResponse', mods.schemas.cycle.CycleResponse),
+            ('CycleDetailResponse', mods.schemas.cycle.CycleDetailResponse),
+            ('ComparisonResponse', mods.schemas.analysis.ComparisonResponse),
+            ('DeviationAnalysisResponse', mods.schemas.analysis.DeviationAnalysisResponse),
         ]
         
         for name, schema_class in schemas:
@@ -205,14 +275,12 @@ def validate_services():
     print("\n⚙️  Validating Services...")
     
     try:
-        from app.services.dataset_service import DatasetService
-        from app.services.cycle_service import CycleService
-        from app.services.analysis_service import AnalysisService
-        
+        mods = _backend_modules()
+
         services = [
-            ('DatasetService', DatasetService),
-            ('CycleService', CycleService),
-            ('AnalysisService', AnalysisService),
+            ('DatasetService', mods.services.dataset.DatasetService),
+            ('CycleService', mods.services.cycle.CycleService),
+            ('AnalysisService', mods.services.analysis.AnalysisService),
         ]
         
         for name, service_class in services:
@@ -242,18 +310,30 @@ def run_full_validation():
     print("=" * 60)
     print("🔍 VerTac System Validation")
     print("=" * 60)
-    
+
     checks = [
-        ("File Structure", validate_file_structure),
-        ("Python Syntax", validate_python_syntax),
-        ("Database Models", validate_database_models),
-        ("Schemas", validate_schemas),
-        ("Services", validate_services),
-        ("API Endpoints", validate_api_endpoints),
+        ("File Structure", validate_file_structure, False),
+        ("Python Syntax", validate_python_syntax, False),
+        ("Database Models", validate_database_models, True),
+        ("Schemas", validate_schemas, True),
+        ("Services", validate_services, True),
+        ("API Endpoints", validate_api_endpoints, True),
     ]
-    
+
+    # The structural validators re-run the heavy import chain; cache
+    # their outcome under a marker of their own, keyed by the same
+    # content hash as test_setup's. imports_ok only proves the modules
+    # import, not that these checks ever ran, so it must not skip them.
+    from test_setup import check_marker, source_hash, write_marker
+    validators_key = source_hash()
+    validators_cached = check_marker("validators_ok", validators_key)
+
     results = {}
-    for name, check_func in checks:
+    for name, check_func, needs_imports in checks:
+        if needs_imports and validators_cached:
+            print(f"\n✓ {name}: sources unchanged since last successful check (cached)")
+            results[name] = True
+            continue
         try:
             results[name] = check_func()
         except Exception as e:
@@ -261,6 +341,11 @@ def run_full_validation():
             import traceback
             traceback.print_exc()
             results[name] = False
+
+    if not validators_cached and all(
+        results[name] for name, _, needs_imports in checks if needs_imports
+    ):
+        write_marker("validators_ok", validators_key)
     
     # Summary
     print("\n" + "=" * 60)
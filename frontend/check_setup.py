@@ -4,6 +4,7 @@ Frontend environment configuration checker
 
 import os
 import json
+from pathlib import Path
 
 
 def check_frontend():
@@ -14,31 +15,32 @@ def check_frontend():
     print()
     
     frontend_dir = os.path.dirname(os.path.abspath(__file__))
-    
+
+    # One scandir replaces a stat() per top-level entry
+    top_level = {entry.name for entry in os.scandir(frontend_dir)}
+
     # Check package.json
-    package_json = os.path.join(frontend_dir, 'package.json')
-    if os.path.exists(package_json):
+    if 'package.json' in top_level:
         print("✓ package.json found")
-        with open(package_json) as f:
+        with open(os.path.join(frontend_dir, 'package.json')) as f:
             data = json.load(f)
             print(f"  Name: {data.get('name')}")
             print(f"  Version: {data.get('version')}")
     else:
         print("❌ package.json not found")
         return False
-    
+
     # Check tsconfig
-    tsconfig = os.path.join(frontend_dir, 'tsconfig.json')
-    if os.path.exists(tsconfig):
+    if 'tsconfig.json' in top_level:
         print("✓ tsconfig.json found")
     else:
         print("❌ tsconfig.json not found")
-    
+
     # Check src directory
     src_dir = os.path.join(frontend_dir, 'src')
-    if os.path.exists(src_dir):
+    if 'src' in top_level:
         print("✓ src directory found")
-        
+
         # Check key files
         key_files = [
             'index.tsx',
@@ -50,19 +52,23 @@ def check_frontend():
             'pages/Analysis.tsx',
             'components/CycleChart.tsx',
         ]
-        
+
+        # Walk src once and check the key files against the set
+        src_files = {
+            p.relative_to(src_dir).as_posix()
+            for p in Path(src_dir).rglob('*') if p.is_file()
+        }
+
         for file in key_files:
-            filepath = os.path.join(src_dir, file)
-            if os.path.exists(filepath):
+            if file in src_files:
                 print(f"  ✓ {file}")
             else:
                 print(f"  ❌ {file} - MISSING")
     else:
         print("❌ src directory not found")
-    
+
     # Check node_modules
-    node_modules = os.path.join(frontend_dir, 'node_modules')
-    if os.path.exists(node_modules):
+    if 'node_modules' in top_level:
         print("✓ node_modules found")
         print("  Dependencies installed")
     else:
@@ -71,7 +77,7 @@ def check_frontend():
     
     # Check .env
     env_file = os.path.join(frontend_dir, '.env')
-    if os.path.exists(env_file):
+    if '.env' in top_level:
         print("✓ .env found")
         with open(env_file) as f:
             for line in f:
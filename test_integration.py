@@ -5,11 +5,16 @@ import sys
 import time
 import subprocess
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 
+from requests.adapters import HTTPAdapter
+
 BASE_DIR = Path(__file__).parent
 BACKEND_DIR = BASE_DIR / "backend"
 VENV_PYTHON = BASE_DIR / ".venv" / "bin" / "python"
+BASE_URL = "http://localhost:8000"
 
 def print_status(message, status="INFO"):
     """Print colored status messages"""
@@ -43,70 +48,81 @@ def check_database():
         print_status("Database exists", "SUCCESS")
     return True
 
-def test_backend_api():
-    """Test backend API endpoints"""
-    print_status("Testing backend API...")
-    
-    # Start backend server in background
+def make_session():
+    """Build one pooled HTTP session reused by every probe"""
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+    return session
+
+@contextmanager
+def backend_server(session):
+    """Start the backend once and keep it up for the whole run"""
     print_status("Starting backend server...")
-    backend_process = subprocess.Popen(
+    process = subprocess.Popen(
         [str(VENV_PYTHON), "-m", "uvicorn", "main:app", "--host", "0.0.0.0", "--port", "8000"],
         cwd=BACKEND_DIR,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE
     )
-    
-    # Wait for server to start
-    print_status("Waiting for server to start...")
-    max_retries = 10
-    for i in range(max_retries):
-        time.sleep(1)
-        try:
-            response = requests.get("http://localhost:8000/health", timeout=1)
-            if response.status_code == 200:
-                print_status(f"Server ready after {i+1} seconds", "SUCCESS")
-                break
-        except:
-            if i == max_retries - 1:
-                raise
-            continue
-    
     try:
-        # Test health endpoint
-        print_status("Testing health endpoint...")
-        response = requests.get("http://localhost:8000/health", timeout=5)
-        if response.status_code == 200:
-            print_status("Health check passed", "SUCCESS")
-        else:
-            print_status(f"Health check failed: {response.status_code}", "ERROR")
-            return False, backend_process
-        
-        # Test API root
-        print_status("Testing API root...")
-        response = requests.get("http://localhost:8000/api/v1/", timeout=5)
-        if response.status_code == 200:
-            print_status("API root accessible", "SUCCESS")
-        else:
-            print_status(f"API root failed: {response.status_code}", "WARNING")
-        
-        # Test datasets endpoint
-        print_status("Testing datasets endpoint...")
-        response = requests.get("http://localhost:8000/api/v1/datasets/", timeout=5)
-        if response.status_code == 200:
-            print_status(f"Datasets endpoint working (found {len(response.json())} datasets)", "SUCCESS")
-        else:
-            print_status(f"Datasets endpoint failed: {response.status_code}", "ERROR")
-            return False, backend_process
-        
+        # Wait for server to start
+        print_status("Waiting for server to start...")
+        max_retries = 10
+        for i in range(max_retries):
+            time.sleep(1)
+            try:
+                response = session.get(f"{BASE_URL}/health", timeout=1)
+                if response.status_code == 200:
+                    print_status(f"Server ready after {i+1} seconds", "SUCCESS")
+                    break
+            except requests.exceptions.RequestException:
+                if i == max_retries - 1:
+                    raise
+                continue
+        yield process
+    finally:
+        print_status("Stopping backend server...", "INFO")
+        process.terminate()
+        process.wait()
+
+def test_backend_api(session):
+    """Test backend API endpoints"""
+    print_status("Testing backend API...")
+
+    # The probes are independent - issue them concurrently over the
+    # pooled connections instead of paying three serial round-trips
+    probes = [
+        ("Health check", f"{BASE_URL}/health", "ERROR"),
+        ("API root", f"{BASE_URL}/api/v1/", "WARNING"),
+        ("Datasets endpoint", f"{BASE_URL}/api/v1/datasets/", "ERROR"),
+    ]
+
+    try:
+        with ThreadPoolExecutor(max_workers=len(probes)) as pool:
+            responses = list(pool.map(
+                lambda probe: session.get(probe[1], timeout=5), probes
+            ))
+
+        for (name, _, fail_level), response in zip(probes, responses):
+            if response.status_code == 200:
+                if name == "Datasets endpoint":
+                    print_status(f"{name} working (found {len(response.json())} datasets)", "SUCCESS")
+                else:
+                    print_status(f"{name} passed", "SUCCESS")
+            else:
+                print_status(f"{name} failed: {response.status_code}", fail_level)
+                if fail_level == "ERROR":
+                    return False
+
         print_status("All backend tests passed!", "SUCCESS")
-        return True, backend_process
-        
+        return True
+
     except requests.exceptions.ConnectionError:
         print_status("Failed to connect to backend server", "ERROR")
-        return False, backend_process
+        return False
     except Exception as e:
         print_status(f"Backend test failed: {str(e)}", "ERROR")
-        return False, backend_process
+        return False
 
 def check_frontend():
     """Check if frontend compiles"""
@@ -164,42 +180,36 @@ def main():
     """Run all integration tests"""
     print_status("Starting VerTac Integration Tests", "INFO")
     print("="*60)
-    
-    backend_process = None
-    
+
     try:
         # Test 1: Database
         if not check_database():
             print_status("Database check failed", "ERROR")
             sys.exit(1)
-        
+
         print()
-        
-        # Test 2: Backend API
-        success, backend_process = test_backend_api()
-        if not success:
-            print_status("Backend API tests failed", "ERROR")
-            sys.exit(1)
-        
+
+        # Test 2: Backend API (server stays up for the whole block and
+        # is torn down by the context manager)
+        session = make_session()
+        with backend_server(session):
+            if not test_backend_api(session):
+                print_status("Backend API tests failed", "ERROR")
+                sys.exit(1)
+
         print()
-        
+
         # Test 3: Frontend
         if not check_frontend():
             print_status("Frontend check failed", "ERROR")
             sys.exit(1)
-        
+
         print()
         print_summary()
-        
+
     except KeyboardInterrupt:
         print_status("\nTests interrupted by user", "WARNING")
-    finally:
-        # Clean up
-        if backend_process:
-            print_status("Stopping backend server...", "INFO")
-            backend_process.terminate()
-            backend_process.wait()
-    
+
     sys.exit(0)
 
 if __name__ == "__main__":